@@ -7,6 +7,8 @@ hit points reach zero.
 """
 import turtle
 import random
+import time
+from collections import deque
 
 # Constants
 SCREEN_WIDTH = 1200
@@ -21,60 +23,114 @@ OBJECT_SPEED = 6
 FPS = 45
 BUFFER = 20  # A small buffer to make collision detection less strict
 HITPOINTS = 5
+RNG_BUFFER_SIZE = 4096
+SCORE_FONT = ('Deja Vu Sans Mono', 24, 'bold')
+PLAYER_FLOOR_Y = -SCREEN_HEIGHT // 2 + PLAYER_SIZE // 2
+SPAWN_X = SCREEN_WIDTH + OBJECT_SIZE // 2
+OBSTACLE_Y = -SCREEN_HEIGHT // 2 + OBJECT_SIZE // 4
+OFFSCREEN_X = -SCREEN_WIDTH // 2 - OBJECT_SIZE // 2
+COLLISION_HALF = OBJECT_SIZE // 2 - BUFFER
+
+
+def _hit(ox, oy, px, py, h=COLLISION_HALF):
+    """Check if an object at (ox, oy) overlaps the player at (px, py)."""
+    dx = ox - px
+    if dx < 0:
+        dx = -dx
+    if dx >= h:  # Most objects are far away on x, so bail out before looking at y
+        return False
+    dy = oy - py
+    if dy < 0:
+        dy = -dy
+    return dy < h
 
 
 class GameObject(turtle.Turtle):
     """Base class for all game objects."""
 
+    __slots__ = ('_pos', '_moveto')
+
     def __init__(self, shape, x, y):
         super().__init__()
+        self._pos = [x, y]  # Kept in step with the turtle so movers never read coordinates back from it
+        self._moveto = self.goto  # Bound once; RawTurtle already owns the name _goto
         self.shape(shape)
         self.penup()
-        self.goto(x, y)
+        self._moveto(x, y)
         self.shapesize(2)
 
+    def place(self, x, y):
+        """Put the object at (x, y)."""
+        self._pos[0] = x
+        self._pos[1] = y
+        self._moveto(x, y)
+
 
 class Player(GameObject):
     """Player object."""
 
+    __slots__ = ('dy', 'hitpoints', '_damage_frames_left')
+
     def __init__(self, x, y):
         super().__init__('turtle', x, y)
         self.color('black', 'green')
         self.dy = 0
         self.hitpoints = HITPOINTS
+        self._damage_frames_left = 0
 
     def move_left(self):
         """Move player to the left."""
-        if self.xcor() - OBJECT_SIZE // 2 > - SCREEN_WIDTH // 2:
-            self.goto(self.xcor() - PLAYER_SPEED, self.ycor())
+        pos = self._pos
+        if pos[0] - OBJECT_SIZE // 2 > - SCREEN_WIDTH // 2:
+            pos[0] -= PLAYER_SPEED
+            self.setx(pos[0])
 
     def move_right(self):
         """Move player to the right."""
-        if self.xcor() + 0.5 * OBJECT_SIZE < WALL:
-            self.goto(self.xcor() + PLAYER_SPEED, self.ycor())
+        pos = self._pos
+        if pos[0] + 0.5 * OBJECT_SIZE < WALL:
+            pos[0] += PLAYER_SPEED
+            self.setx(pos[0])
 
     def jump(self):
         """Make the player jump."""
-        if self.ycor() <= -SCREEN_HEIGHT // 2 + PLAYER_SIZE // 2:
+        if self._pos[1] <= PLAYER_FLOOR_Y:
             self.dy = 15
 
     def fall(self):
         """Apply gravity to the player."""
-        self.goto(self.xcor(), self.ycor() + self.dy)
+        y = self._pos[1]
+        if self.dy == 0 and y <= PLAYER_FLOOR_Y:
+            return  # Standing on the ground, nothing to move
+
+        y += self.dy
         self.dy -= GRAVITY
 
-        if self.ycor() <= -SCREEN_HEIGHT // 2 + PLAYER_SIZE // 2:
+        if y <= PLAYER_FLOOR_Y:
             self.dy = 0
-            self.goto(self.xcor(), -SCREEN_HEIGHT // 2 + PLAYER_SIZE // 2)
+            y = PLAYER_FLOOR_Y
+        self._pos[1] = y
+        self.sety(y)
 
-    def damage(self):
-        """Flashes red when player takes damage"""
-        return self.color('black', 'red')
+    def damage(self, frames):
+        """Flashes red for the given number of frames when player takes damage"""
+        if not self._damage_frames_left:
+            self.color('black', 'red')
+        self._damage_frames_left = frames
+
+    def recover(self):
+        """Count down the damage flash and turn green again when it ends."""
+        if self._damage_frames_left:
+            self._damage_frames_left -= 1
+            if not self._damage_frames_left:
+                self.color('black', 'green')
 
 
 class Obstacle(GameObject):
     """Obstacle object."""
 
+    __slots__ = ('counted', 'width_multiplier', 'height_multiplier')
+
     def __init__(self, x, y):
         super().__init__('arrow', x, y)
         self.color('grey', 'black')
@@ -86,31 +142,86 @@ class Obstacle(GameObject):
         self.counted = False
 
     def move(self):
-        """Move the obstacle."""
-        self.goto(self.xcor() - OBJECT_SPEED, self.ycor())
+        """Move the obstacle and return its new position."""
+        pos = self._pos
+        pos[0] -= OBJECT_SPEED
+        self.setx(pos[0])  # Horizontal only, y never changes
+        return pos[0], pos[1]
 
-    def is_out_of_screen(self):
-        """Check if the obstacle is out of the screen."""
-        return self.xcor() < -SCREEN_WIDTH // 2 - OBJECT_SIZE // 2
+    def is_out_of_screen(self, x):
+        """Check if the obstacle is out of the screen at x-coordinate x."""
+        return x < OFFSCREEN_X
 
 
 class Pickup(GameObject):
     """Pickup object."""
 
+    __slots__ = ('speed',)  # Shadows Turtle.speed(), which pickups never use
+
     def __init__(self, x, y):
         super().__init__('circle', x, y)
         self.color('yellow', 'orange')
         self.speed = OBJECT_SPEED
 
-    def move(self):
-        """Move the pickup."""
-        self.speed = random.uniform(OBJECT_SPEED // 4, OBJECT_SPEED)
-        wobble = random.uniform(-2, 2)  # Make the pickup move up and down randomly
-        self.goto(self.xcor() - self.speed, self.ycor() + wobble)
+    def move(self, speed, wobble):
+        """Move the pickup at the given speed, wobbling up or down, and return its new position."""
+        self.speed = speed
+        pos = self._pos
+        pos[0] -= speed
+        pos[1] += wobble
+        self._moveto(pos[0], pos[1])
+        return pos[0], pos[1]
+
+    def is_out_of_screen(self, x):
+        """Check if the pickup is out of the screen at x-coordinate x."""
+        return x < OFFSCREEN_X
+
+
+class ScoreBoard:
+    """Right-aligned number display that only rewrites the digit columns that changed."""
+
+    def __init__(self, x, y, label, color):
+        self.x = x
+        self.y = y
+        self.label = label
+        self.color = color
+        self.label_writer = self.create_column_writer()
+        self.digit_writers = []
+        self.digits = ''
+
+        # The font is monospaced, so every digit column is as wide as a written '0'
+        self.label_writer.write('0', move=True, font=SCORE_FONT)
+        self.digit_width = self.label_writer.xcor()
+        self.label_writer.clear()
+
+    def create_column_writer(self):
+        """Create a hidden writer for one column of the display."""
+        writer = turtle.Turtle(visible=False, undobuffersize=0)
+        writer.penup()
+        writer.color(self.color)
+        return writer
 
-    def is_out_of_screen(self):
-        """Check if the pickup is out of the screen."""
-        return self.xcor() < -SCREEN_WIDTH // 2 - OBJECT_SIZE // 2
+    def show(self, value):
+        """Show value, rewriting only the digits that differ from the last one shown."""
+        digits = str(value)
+        if len(digits) != len(self.digits):
+            while len(self.digit_writers) < len(digits):
+                writer = self.create_column_writer()
+                writer.goto(self.x - len(self.digit_writers) * self.digit_width, self.y)
+                self.digit_writers.append(writer)
+            self.label_writer.clear()
+            self.label_writer.goto(self.x - len(digits) * self.digit_width, self.y)
+            self.label_writer.write(self.label, align='right', font=SCORE_FONT)
+
+        width = max(len(digits), len(self.digits))
+        new = digits.rjust(width)
+        old = self.digits.rjust(width)
+        for column in range(1, width + 1):  # Counted from the right, units first
+            if new[-column] != old[-column]:
+                writer = self.digit_writers[column - 1]
+                writer.clear()
+                writer.write(new[-column], align='right', font=SCORE_FONT)
+        self.digits = digits
 
 
 class SidescrollingGame:
@@ -128,35 +239,54 @@ class SidescrollingGame:
             self.screen.bgcolor('black')
 
         # Player
-        self.player = Player(-SCREEN_WIDTH // 3, -SCREEN_HEIGHT // 2 + PLAYER_SIZE // 2)
+        self.player = Player(-SCREEN_WIDTH // 3, PLAYER_FLOOR_Y)
 
         # Objects
-        self.waiting_obstacles = [self.create_obstacle() for _ in range(10)]
-        self.in_play_obstacles = []
-        self.waiting_pickups = [self.create_pickup() for _ in range(10)]
-        self.in_play_pickups = []
+        self.waiting_obstacles = deque(self.create_obstacle() for _ in range(10))
+        self.in_play_obstacles = set()
+        self.waiting_pickups = deque(self.create_pickup() for _ in range(10))
+        self.in_play_pickups = set()
+
+        # Pre-rolled pickup speeds and wobbles, cycled through instead of calling random every frame
+        self._speed_buf = [random.uniform(OBJECT_SPEED // 4, OBJECT_SPEED) for _ in range(RNG_BUFFER_SIZE)]
+        self._wobble_buf = [random.uniform(-2, 2) for _ in range(RNG_BUFFER_SIZE)]  # Up and down wobble
+        self._rng_idx = 0
 
         # Score and hitpoints
         self.score = 0
-        self.score_writer = self.create_writer(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 - 50, 'Score: 0', 'black')
+        self.score_board = ScoreBoard(SCREEN_WIDTH // 2 - 20, SCREEN_HEIGHT // 2 - 50, 'Score: ', 'black')
+        self.score_board.show(self.score)
         self.hitpoints_writer = self.create_writer(-SCREEN_WIDTH // 2 + 100, SCREEN_HEIGHT // 2 - 50,
                                                    f'Hitpoints: {self.player.hitpoints}', 'black')
+        self._score_dirty = False
+        self._hp_dirty = False
+
+        # Bound methods used every frame, resolved once
+        self._update = self.screen.update
+        self._ontimer = self.screen.ontimer
+        self._score_show = self.score_board.show
+        self._hp_clear = self.hitpoints_writer.clear
+        self._hp_write = self.hitpoints_writer.write
 
         # Start game loop
         self.obstacle_timer = 0
         self.pickup_timer = 15
+        self.screen.listen()
         self.screen.onkeypress(self.player.jump, 'space')
+        self.screen.onkeypress(self.player.move_left, 'a')
+        self.screen.onkeypress(self.player.move_right, 'd')
+        self._next_tick = time.perf_counter()
         self.game_loop()
 
     def create_obstacle(self):
         """Create a new obstacle."""
-        obstacle = Obstacle(SCREEN_WIDTH + OBJECT_SIZE // 2, -SCREEN_HEIGHT // 2 + OBJECT_SIZE // 4)
+        obstacle = Obstacle(SPAWN_X, OBSTACLE_Y)
         obstacle.left(90)
         return obstacle
 
     def create_pickup(self):
         """Create a new pickup."""
-        return Pickup(SCREEN_WIDTH + OBJECT_SIZE // 2,
+        return Pickup(SPAWN_X,
                       random.randint(-SCREEN_HEIGHT // 2 + round(OBJECT_SIZE * 1.5), -OBJECT_SIZE // 2 - 45))
 
     def create_writer(self, x, y, text, color):
@@ -166,65 +296,75 @@ class SidescrollingGame:
         writer.penup()
         writer.goto(x, y)
         writer.color(color)
-        writer.write(text, align='center', font=('Deja Vu Sans Mono', 24, 'bold'))
+        writer.write(text, align='center', font=SCORE_FONT)
         return writer
 
     def update_score(self):
         """Update the score."""
-        self.score_writer.clear()
-        self.score_writer.write(f'Score: {self.score}', align='center', font=('Deja Vu Sans Mono', 24, 'bold'))
+        self._score_show(self.score)
 
     def update_hitpoints(self):
         """Update the hitpoints."""
-        self.hitpoints_writer.clear()
-        self.hitpoints_writer.write(f'Hitpoints: {self.player.hitpoints}', align='center',
-                                    font=('Deja Vu Sans Mono', 24, 'bold'))
-
-    def check_collision(self, obj):
-        """Check if the player has collided with an object."""
-
-        return (abs(obj.xcor() - self.player.xcor()) < OBJECT_SIZE // 2 - BUFFER
-                and abs(obj.ycor() - self.player.ycor()) < OBJECT_SIZE // 2 - BUFFER)
-
-    def handle_obstacle(self, obstacle):
-        """Handle an obstacle."""
-        if obstacle.is_out_of_screen():
-            self.reset_obstacle(obstacle)
-        elif self.check_collision(obstacle):
-            self.player.color('black', 'red')
-            self.screen.update()
-            self.player.hitpoints -= 1
-            self.update_hitpoints()
-            self.reset_obstacle(obstacle)
-            self.screen.ontimer(self.player.damage(), 20)
-            self.player.color('black', 'green')
-        elif obstacle.xcor() < self.player.xcor() and not obstacle.counted:
-            self.score += 1
-            self.update_score()
-            obstacle.counted = True
-
-    def handle_pickup(self, pickup):
-        """Handle a pickup."""
-        if pickup.is_out_of_screen():
-            self.reset_pickup(pickup)
-        elif self.check_collision(pickup):
-            self.score += 5
-            self.update_score()
-            self.reset_pickup(pickup)
+        self._hp_clear()
+        self._hp_write(f'Hitpoints: {self.player.hitpoints}', align='center', font=SCORE_FONT)
+
+    def step_obstacles(self, px, py):
+        """Move the obstacles in play and apply this frame's hits and passes."""
+        hits = passes = 0
+        x_lo = px - COLLISION_HALF  # Only objects strictly inside this band can touch the player
+        x_hi = px + COLLISION_HALF
+        for obstacle in list(self.in_play_obstacles):
+            ox, oy = obstacle.move()
+            if obstacle.is_out_of_screen(ox):
+                self.reset_obstacle(obstacle)
+            elif x_lo < ox < x_hi and _hit(ox, oy, px, py):
+                hits += 1
+                self.reset_obstacle(obstacle)
+            elif ox < px and not obstacle.counted:
+                passes += 1
+                obstacle.counted = True
+
+        if hits:
+            self.player.damage(2)
+            self.player.hitpoints -= hits
+            self._hp_dirty = True
+        if passes:
+            self.score += passes
+            self._score_dirty = True
+
+    def step_pickups(self, px, py):
+        """Move the pickups in play and apply the ones collected this frame."""
+        collected = 0
+        x_lo = px - COLLISION_HALF
+        x_hi = px + COLLISION_HALF
+        idx = self._rng_idx
+        for pickup in list(self.in_play_pickups):
+            ox, oy = pickup.move(self._speed_buf[idx], self._wobble_buf[idx])
+            idx = (idx + 1) % RNG_BUFFER_SIZE
+            if pickup.is_out_of_screen(ox):
+                self.reset_pickup(pickup)
+            elif x_lo < ox < x_hi and _hit(ox, oy, px, py):
+                collected += 1
+                self.reset_pickup(pickup)
+        self._rng_idx = idx
+
+        if collected:
+            self.score += 5 * collected
+            self._score_dirty = True
 
     def reset_obstacle(self, obstacle):
         """Reset an obstacle."""
-        self.in_play_obstacles.remove(obstacle)
+        self.in_play_obstacles.discard(obstacle)
         self.waiting_obstacles.append(obstacle)
-        obstacle.goto(SCREEN_WIDTH + OBJECT_SIZE // 2, -SCREEN_HEIGHT // 2 + OBJECT_SIZE // 4)
+        obstacle.place(SPAWN_X, OBSTACLE_Y)
         obstacle.counted = False
 
     def reset_pickup(self, pickup):
         """Reset a pickup."""
-        self.in_play_pickups.remove(pickup)
+        self.in_play_pickups.discard(pickup)
         self.waiting_pickups.append(pickup)
-        pickup.goto(SCREEN_WIDTH + OBJECT_SIZE // 2,
-                    random.randint(-SCREEN_HEIGHT // 2 + OBJECT_SIZE // 2, -OBJECT_SIZE // 2))
+        pickup.place(SPAWN_X,
+                     random.randint(-SCREEN_HEIGHT // 2 + OBJECT_SIZE // 2, -OBJECT_SIZE // 2))
 
     def game_over(self):
         """Check if the game is over."""
@@ -239,44 +379,47 @@ class SidescrollingGame:
         game_over_turtle.penup()
         game_over_turtle.goto(0, 50)
         game_over_turtle.color('white')
-        game_over_turtle.write('Game Over', align='center', font=('Deja Vu Sans Mono', 24, 'bold'))
+        game_over_turtle.write('Game Over', align='center', font=SCORE_FONT)
         game_over_turtle.goto(0, -50)
-        game_over_turtle.write(f'Final score: {self.score}', align='center', font=('Deja Vu Sans Mono', 24, 'bold'))
+        game_over_turtle.write(f'Final score: {self.score}', align='center', font=SCORE_FONT)
 
     def game_loop(self):
         """The main game loop."""
         if not self.game_over():
             self.obstacle_timer += 1
             self.pickup_timer += 1
-            if (self.obstacle_timer >= 30 and len(self.in_play_obstacles) < 10
-                    and len(self.waiting_obstacles) > 0 and random.random() <= 0.5):
-                if self.waiting_obstacles:
-                    obstacle = self.waiting_obstacles.pop(0)
-                    self.in_play_obstacles.append(obstacle)
+            # Cheapest and most often false checks first, the random roll last
+            if (self.obstacle_timer >= 30 and self.waiting_obstacles
+                    and len(self.in_play_obstacles) < 10 and random.random() <= 0.5):
+                obstacle = self.waiting_obstacles.popleft()
+                self.in_play_obstacles.add(obstacle)
                 self.obstacle_timer = 0
-            if (self.pickup_timer >= 12 and len(self.in_play_pickups) < 1
-                    and len(self.waiting_pickups) > 0 and random.random() < 0.2):
-                if self.waiting_pickups:
-                    pickup = self.waiting_pickups.pop(0)
-                    self.in_play_pickups.append(pickup)
+            if (self.pickup_timer >= 12 and self.waiting_pickups
+                    and not self.in_play_pickups and random.random() < 0.2):
+                pickup = self.waiting_pickups.popleft()
+                self.in_play_pickups.add(pickup)
                 self.pickup_timer = 0
 
-            self.screen.listen()
-            self.screen.onkeypress(self.player.move_left, 'a')
-            self.screen.onkeypress(self.player.move_right, 'd')
-
             self.player.fall()
-
-            for obstacle in self.in_play_obstacles:
-                obstacle.move()
-                self.handle_obstacle(obstacle)
-
-            for pickup in self.in_play_pickups:
-                pickup.move()
-                self.handle_pickup(pickup)
-
-            self.screen.update()
-            self.screen.ontimer(self.game_loop, FPS)
+            self.player.recover()
+            px = self.player.xcor()
+            py = self.player.ycor()
+            self.step_obstacles(px, py)
+            self.step_pickups(px, py)
+
+            if self._score_dirty:
+                self.update_score()
+                self._score_dirty = False
+            if self._hp_dirty:
+                self.update_hitpoints()
+                self._hp_dirty = False
+            self._update()
+
+            # Schedule against a fixed clock so the frame's own work doesn't add to the delay.
+            # If a frame overran, restart the clock from now instead of bursting to catch up.
+            now = time.perf_counter()
+            self._next_tick = max(self._next_tick + FPS / 1000, now)
+            self._ontimer(self.game_loop, max(1, int((self._next_tick - now) * 1000)))
         else:
             self.show_game_over_screen()
 